@@ -26,14 +26,17 @@ should wrap up work and perform exploitation phase.
 2. Send SIGINT to notify resolver to stop the resolution and report results
 computed so far.
 
+The probe exits right after sending the signal, so SIGINT follows SIGUSR1 on the
+next probe run. The time given to the predictor for the exploitation phase is
+therefore set by the probe's periodSeconds, not by its timeoutSeconds.
+
 This Python script *HAS TO* be run in a container as it kills all the processes
-except the main process (PID 1).
+except the main process (PID 1) and the liveness probe itself.
 """
 
 import sys
 import os
 import signal
-from pathlib import Path
 
 # Create this file on kill for better reports in adviser logs.
 _LIVENESS_PROBE_KILL_FILE = "/tmp/thoth_adviser_cpu_timeout"
@@ -41,28 +44,30 @@ _LIVENESS_PROBE_KILL_FILE = "/tmp/thoth_adviser_cpu_timeout"
 
 def main() -> int:
     """Kill all processes except for main."""
-    pids = [int(pid) for pid in os.listdir("/proc") if pid.isdigit()]
+    # Terminate quietly instead of reporting BrokenPipeError if the kubelet closes stdout early.
+    signal.signal(signal.SIGPIPE, signal.SIG_DFL)
 
-    liveness_file = Path(_LIVENESS_PROBE_KILL_FILE)
-    if liveness_file.exists():
+    try:
+        # Atomically create the file - an existing one means the probe has already been run.
+        os.close(os.open(_LIVENESS_PROBE_KILL_FILE, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+    except FileExistsError:
         signal_num = signal.SIGINT
     else:
-        liveness_file.touch()
         signal_num = signal.SIGUSR1
 
-    for pid in pids:
-        if pid == 1:
-            # No attempt to kill main process.
-            continue
-        if os.getpid() == pid:
-            # Do not commit suicide.
-            continue
-
-        print("Killing process with PID %d with %d" % (pid, signal_num))
-        os.kill(pid, signal_num)
+    # Signal all the processes in one go. Linux delivers kill(-1, ...) to every process the caller
+    # can signal except for PID 1 (the main process in the container's PID namespace) and the
+    # caller itself, so no /proc walk is needed. Report only once signals are sent so that a closed
+    # stdout cannot prevent them from being delivered.
+    try:
+        os.kill(-1, signal_num)
+    except ProcessLookupError:
+        # ESRCH - adviser runs as PID 1 without a forked sub-process, there is nothing else to signal.
+        print("No processes except for PID 1 to signal with %d" % signal_num)
+    else:
+        print("Killed all processes except for PID 1 with %d" % signal_num)
 
-    # Let liveness probe always fail with timeout.
-    signal.pause()
+    # Let liveness probe always fail, a non-zero exit code is reported as a probe failure.
     return 1
 
 
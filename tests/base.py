@@ -22,7 +22,6 @@ from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
-import os
 
 from voluptuous import All
 from voluptuous import Any as SchemaAny
@@ -54,7 +53,7 @@ class AdviserJustificationSchemaError(AdviserTestCaseException):
 class AdviserTestCase:
     """A base class for implementing adviser's test cases."""
 
-    data_dir = Path(os.path.dirname(os.path.realpath(__file__))) / "data"
+    data_dir = Path(__file__).parent / "data"
 
     JUSTIFICATION_SAMPLE_1 = [
         {"message": "Justification sample 1", "type": "WARNING", "link": "https://thoth-station.ninja"},
@@ -17,6 +17,7 @@
 
 """Test implementation of Adaptive Simulated Annealing (ASA)."""
 
+import random
 from typing import Callable
 
 import flexmock
@@ -128,3 +129,28 @@ class TestAdaptiveSimulatedAnnealing(AdviserTestCase):
             assert package_tuple is not None
             assert package_tuple[0] in next_state.unresolved_dependencies
             assert package_tuple in next_state.unresolved_dependencies[package_tuple[0]].values()
+
+    def test_run_single_state(self, state: State) -> None:
+        """Test the top rated state is expanded without sampling a neighbour if the beam holds one state."""
+        beam = Beam()
+        beam.add_state(state)
+
+        flexmock(random).should_receive("randrange").times(0)
+        flexmock(random).should_receive("random").times(0)
+
+        predictor = AdaptiveSimulatedAnnealing(keep_history=True)
+        context = flexmock(
+            accepted_final_states_count=0,
+            count=3,
+            iteration=1,
+            limit=100,
+            beam=beam,
+        )
+        with predictor.assigned_context(context):
+            next_state, package_tuple = predictor.run()
+
+        assert next_state is state
+        assert package_tuple[0] in state.unresolved_dependencies
+        assert len(predictor._temperature_history) == 1
+        assert predictor._temperature_history[0][1] is True
+        assert predictor._temperature_history[0][2] == 0.0
@@ -17,10 +17,16 @@
 
 """Test implementation of generic v1 prescription unit handling."""
 
+import copy
 import logging
+from typing import Any
+from typing import Dict
+from typing import Tuple
 from typing import Type
 
 import pytest
+import yaml
+from voluptuous import Schema
 
 from thoth.adviser.exceptions import NotAcceptable
 from thoth.adviser.exceptions import EagerStopPipeline
@@ -30,6 +36,27 @@ from thoth.adviser.prescription.v1 import UnitPrescription
 from ...base import AdviserTestCase
 
 
+# Schema instances are not hashable, key cached prescriptions on the schema identity - schemas are module-level
+# constants alive for the whole test session.
+_PRESCRIPTION_CACHE: Dict[Tuple[int, str], Dict[str, Any]] = {}
+
+
+def load_prescription(schema: Schema, prescription_str: str) -> Dict[str, Any]:
+    """Obtain a parsed prescription checked against the given schema.
+
+    Parsing and validation are done once per schema and prescription, a copy is returned so that units assigned
+    the prescription cannot alter cached results.
+    """
+    key = (id(schema), prescription_str)
+    prescription = _PRESCRIPTION_CACHE.get(key)
+    if prescription is None:
+        prescription = yaml.load(prescription_str, Loader=yaml.CSafeLoader)
+        schema(prescription)
+        _PRESCRIPTION_CACHE[key] = prescription
+
+    return copy.deepcopy(prescription)
+
+
 class AdviserUnitPrescriptionTestCase(AdviserTestCase):
     """Test implementation of generic v1 prescription unit handling."""
 
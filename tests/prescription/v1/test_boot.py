@@ -21,13 +21,13 @@ from typing import Optional
 
 import flexmock
 import pytest
-import yaml
 
 from thoth.adviser.context import Context
 from thoth.adviser.prescription.v1 import BootPrescription
 from thoth.adviser.prescription.v1.schema import PRESCRIPTION_BOOT_SCHEMA
 
 from .base import AdviserUnitPrescriptionTestCase
+from .base import load_prescription
 
 
 class TestBootPrescription(AdviserUnitPrescriptionTestCase):
@@ -52,9 +52,7 @@ run:
       message: "Hello, Thoth!"
       link: https://thoth-station.ninja
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_BOOT_SCHEMA(prescription)
-        BootPrescription.set_prescription(prescription)
+        BootPrescription.set_prescription(load_prescription(PRESCRIPTION_BOOT_SCHEMA, prescription_str))
         self.check_run_stack_info(context, BootPrescription)
 
     def test_run_eager_stop_pipeline(self, context: Context) -> None:
@@ -68,9 +66,7 @@ should_include:
 run:
   eager_stop_pipeline: This is exception message reported
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_BOOT_SCHEMA(prescription)
-        BootPrescription.set_prescription(prescription)
+        BootPrescription.set_prescription(load_prescription(PRESCRIPTION_BOOT_SCHEMA, prescription_str))
         self.check_run_eager_stop_pipeline(context, BootPrescription)
 
     def test_run_not_acceptable(self, context: Context) -> None:
@@ -85,9 +81,7 @@ should_include:
 run:
   not_acceptable: This is exception message reported
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_BOOT_SCHEMA(prescription)
-        BootPrescription.set_prescription(prescription)
+        BootPrescription.set_prescription(load_prescription(PRESCRIPTION_BOOT_SCHEMA, prescription_str))
         self.check_run_not_acceptable(context, BootPrescription)
 
     @pytest.mark.parametrize("log_level", ["INFO", "ERROR", "WARNING"])
@@ -105,9 +99,7 @@ run:
     message: Some message logged
     type: {log_level}
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_BOOT_SCHEMA(prescription)
-        BootPrescription.set_prescription(prescription)
+        BootPrescription.set_prescription(load_prescription(PRESCRIPTION_BOOT_SCHEMA, prescription_str))
         self.check_run_log(caplog, context, log_level, BootPrescription)
 
     @pytest.mark.parametrize("package_name", [None, "flask"])
@@ -127,9 +119,7 @@ run:
       message: "Unable to perform this operation"
       link: https://thoth-station.ninja
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_BOOT_SCHEMA(prescription)
-        BootPrescription.set_prescription(prescription)
+        BootPrescription.set_prescription(load_prescription(PRESCRIPTION_BOOT_SCHEMA, prescription_str))
         unit = BootPrescription()
         unit.update_configuration({"package_name": package_name})
         assert unit.configuration["package_name"] == package_name
@@ -151,9 +141,7 @@ run:
       link: https://thoth-station.ninja
 """
         flexmock(BootPrescription).should_receive("_should_include_base").replace_with(lambda _: True).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_BOOT_SCHEMA(prescription)
-        BootPrescription.set_prescription(prescription)
+        BootPrescription.set_prescription(load_prescription(PRESCRIPTION_BOOT_SCHEMA, prescription_str))
 
         builder_context = flexmock()
         assert list(BootPrescription.should_include(builder_context)) == [
@@ -192,9 +180,7 @@ run:
       link: https://thoth-station.ninja
 """
         flexmock(BootPrescription).should_receive("_should_include_base").replace_with(lambda _: True).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_BOOT_SCHEMA(prescription)
-        BootPrescription.set_prescription(prescription)
+        BootPrescription.set_prescription(load_prescription(PRESCRIPTION_BOOT_SCHEMA, prescription_str))
 
         builder_context = flexmock()
         assert list(BootPrescription.should_include(builder_context)) == [
@@ -245,9 +231,7 @@ run:
       link: https://thoth-station.ninja
 """
         flexmock(BootPrescription).should_receive("_should_include_base").replace_with(lambda _: True).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_BOOT_SCHEMA(prescription)
-        BootPrescription.set_prescription(prescription)
+        BootPrescription.set_prescription(load_prescription(PRESCRIPTION_BOOT_SCHEMA, prescription_str))
 
         builder_context = flexmock()
         assert list(BootPrescription.should_include(builder_context)) == [
@@ -281,9 +265,7 @@ run:
       link: https://thoth-station.ninja
 """
         flexmock(BootPrescription).should_receive("_should_include_base").replace_with(lambda _: False).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_BOOT_SCHEMA(prescription)
-        BootPrescription.set_prescription(prescription)
+        BootPrescription.set_prescription(load_prescription(PRESCRIPTION_BOOT_SCHEMA, prescription_str))
 
         builder_context = flexmock()
         assert list(BootPrescription.should_include(builder_context)) == []
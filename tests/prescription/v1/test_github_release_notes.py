@@ -17,7 +17,6 @@
 
 """Test implementation of GitHub release notes wrap."""
 
-import yaml
 
 from thoth.adviser.context import Context
 from thoth.adviser.state import State
@@ -25,6 +24,7 @@ from thoth.adviser.prescription.v1 import GitHubReleaseNotesWrapPrescription
 from thoth.adviser.prescription.v1.schema import PRESCRIPTION_GITHUB_RELEASE_NOTES_WRAP_SCHEMA
 
 from .base import AdviserUnitPrescriptionTestCase
+from .base import load_prescription
 
 
 class TestGitHubReleaseNotesWrapPrescription(AdviserUnitPrescriptionTestCase):
@@ -45,9 +45,9 @@ run:
       package_version:
         name: adviser
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_GITHUB_RELEASE_NOTES_WRAP_SCHEMA(prescription)
-        GitHubReleaseNotesWrapPrescription.set_prescription(prescription)
+        GitHubReleaseNotesWrapPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_GITHUB_RELEASE_NOTES_WRAP_SCHEMA, prescription_str)
+        )
 
         state.resolved_dependencies.clear()
         state.add_resolved_dependency(("flask", "1.0.0", "https://pypi.org/simple"))
@@ -93,9 +93,9 @@ run:
         version: '~=1.0.0'
         index_url: https://pypi.org/simple
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_GITHUB_RELEASE_NOTES_WRAP_SCHEMA(prescription)
-        GitHubReleaseNotesWrapPrescription.set_prescription(prescription)
+        GitHubReleaseNotesWrapPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_GITHUB_RELEASE_NOTES_WRAP_SCHEMA, prescription_str)
+        )
 
         state.resolved_dependencies.clear()
         # Will NOT occur in the justification:
@@ -17,6 +17,7 @@
 
 """Test implementation of prescription handling."""
 
+import flexmock
 import pytest
 import yaml
 
@@ -54,6 +55,22 @@ class TestPrescription(AdviserTestCase):
         with pytest.raises(PrescriptionSchemaError):
             Prescription.from_dict({"foo": "bar"}, prescription_name="thoth", prescription_release="2021.06.15")
 
+    def test_from_dict_validate_disabled(self) -> None:
+        """Test schema validation is not performed if turned off."""
+        flexmock(Prescription, _VALIDATE_PRESCRIPTION_SCHEMA=False)
+
+        prescription = {"units": {"boots": [{"name": "BootUnit"}]}}
+        instance = Prescription.from_dict(prescription, prescription_name="thoth", prescription_release="2021.06.15")
+        assert list(instance.boots_dict) == ["thoth.BootUnit"]
+
+    def test_validate_schema_enforced(self) -> None:
+        """Test explicit validation checks the schema even if turned off for loading."""
+        flexmock(Prescription, _VALIDATE_PRESCRIPTION_SCHEMA=False)
+
+        prescription_str = "units:\n  boots:\n  - name: BootUnit\n"
+        with pytest.raises(PrescriptionSchemaError):
+            Prescription.validate(prescription_str)
+
     def test_from_dict_duplicate_name_error(self) -> None:
         """Test raising duplicate error if unit names clash."""
         unit = {
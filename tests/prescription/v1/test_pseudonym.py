@@ -21,7 +21,6 @@ from typing import Optional
 
 import flexmock
 import pytest
-import yaml
 
 from thoth.adviser.context import Context
 from thoth.adviser.prescription.v1 import PseudonymPrescription
@@ -30,6 +29,7 @@ from thoth.python import PackageVersion
 from thoth.python import Source
 
 from .base import AdviserUnitPrescriptionTestCase
+from .base import load_prescription
 
 
 class TestPseudonymPrescription(AdviserUnitPrescriptionTestCase):
@@ -60,9 +60,7 @@ run:
       message: Some stack warning message
       link: https://thoth-station.ninja
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_PSEUDONYM_SCHEMA(prescription)
-        PseudonymPrescription.set_prescription(prescription)
+        PseudonymPrescription.set_prescription(load_prescription(PRESCRIPTION_PSEUDONYM_SCHEMA, prescription_str))
         package_version = PackageVersion(
             name="flask",
             version="==1.1.0",
@@ -108,9 +106,7 @@ run:
     message: Yet some message logged
     type: {log_level}
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_PSEUDONYM_SCHEMA(prescription)
-        PseudonymPrescription.set_prescription(prescription)
+        PseudonymPrescription.set_prescription(load_prescription(PRESCRIPTION_PSEUDONYM_SCHEMA, prescription_str))
         package_version = PackageVersion(
             name="tensorflow",
             version="==2.4.1dev0",
@@ -152,9 +148,7 @@ run:
       locked_version: null
       index_url: 'https://pypi.org/simple'
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_PSEUDONYM_SCHEMA(prescription)
-        PseudonymPrescription.set_prescription(prescription)
+        PseudonymPrescription.set_prescription(load_prescription(PRESCRIPTION_PSEUDONYM_SCHEMA, prescription_str))
 
         package_version = PackageVersion(
             name="tensorflow-cpu",
@@ -207,9 +201,7 @@ run:
       index_url: 'https://pypi.org/simple'
 """
         flexmock(PseudonymPrescription).should_receive("_should_include_base").replace_with(lambda _: True).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_PSEUDONYM_SCHEMA(prescription)
-        PseudonymPrescription.set_prescription(prescription)
+        PseudonymPrescription.set_prescription(load_prescription(PRESCRIPTION_PSEUDONYM_SCHEMA, prescription_str))
 
         builder_context = flexmock()
         assert list(PseudonymPrescription.should_include(builder_context)) == [
@@ -258,9 +250,7 @@ run:
       index_url: 'https://pypi.org/simple'
 """
         flexmock(PseudonymPrescription).should_receive("_should_include_base").replace_with(lambda _: True).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_PSEUDONYM_SCHEMA(prescription)
-        PseudonymPrescription.set_prescription(prescription)
+        PseudonymPrescription.set_prescription(load_prescription(PRESCRIPTION_PSEUDONYM_SCHEMA, prescription_str))
 
         builder_context = flexmock()
         assert list(PseudonymPrescription.should_include(builder_context)) == [
@@ -354,9 +344,7 @@ run:
       index_url: 'https://pypi.org/simple'
 """
         flexmock(PseudonymPrescription).should_receive("_should_include_base").replace_with(lambda _: False).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_PSEUDONYM_SCHEMA(prescription)
-        PseudonymPrescription.set_prescription(prescription)
+        PseudonymPrescription.set_prescription(load_prescription(PRESCRIPTION_PSEUDONYM_SCHEMA, prescription_str))
 
         builder_context = flexmock()
         assert list(PseudonymPrescription.should_include(builder_context)) == []
@@ -381,8 +369,7 @@ run:
       name: flask
       index_url: 'https://pypi.org/simple'
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_PSEUDONYM_SCHEMA(prescription)
+        prescription = load_prescription(PRESCRIPTION_PSEUDONYM_SCHEMA, prescription_str)
         PseudonymPrescription.set_prescription(prescription)
         package_version = PackageVersion(
             name="flask",
@@ -409,3 +396,106 @@ run:
             result = list(unit.run(package_version))
 
         assert result == [("flask", "1.1.0", "https://pypi.org/simple")]
+
+    def test_run_version_no_match(self, context: Context) -> None:
+        """Check no pseudonyms are yielded and no queries are done if the version does not match."""
+        prescription_str = """
+name: PseudonymUnit
+type: pseudonym
+should_include:
+  times: 1
+  adviser_pipeline: true
+match:
+  package_version:
+    name: flask
+    version: '>1.0,<=1.1.0'
+    index_url: 'https://pypi.org/simple'
+run:
+  yield:
+    yield_matched_version: true
+    package_version:
+      name: flask
+      index_url: 'https://pypi.org/simple'
+"""
+        PseudonymPrescription.set_prescription(load_prescription(PRESCRIPTION_PSEUDONYM_SCHEMA, prescription_str))
+        package_version = PackageVersion(
+            name="flask",
+            version="==2.0.0",
+            index=Source("https://pypi.org/simple"),
+            develop=False,
+        )
+
+        matched_package_version = PackageVersion(
+            name="flask",
+            version="==1.1.0",
+            index=Source("https://pypi.org/simple"),
+            develop=False,
+        )
+
+        expected_result = [("flask", "1.1.0", "https://pypi.org/simple")]
+        context.graph.should_receive("get_solved_python_package_versions_all").with_args(
+            package_name="flask",
+            package_version="1.1.0",
+            index_url="https://pypi.org/simple",
+            count=None,
+            os_name=context.project.runtime_environment.operating_system.name,
+            os_version=context.project.runtime_environment.operating_system.version,
+            python_version=context.project.runtime_environment.python_version,
+            distinct=True,
+            is_missing=False,
+        ).and_return(expected_result).once()
+
+        unit = PseudonymPrescription()
+        unit.pre_run()
+        with unit.assigned_context(context):
+            assert list(unit.run(package_version)) == []
+            assert list(unit.run(package_version)) == []
+            assert list(unit.run(matched_package_version)) == expected_result
+            assert list(unit.run(package_version)) == []
+
+    def test_run_query_once(self, context: Context) -> None:
+        """Check pseudonyms are queried once per version across multiple runs."""
+        prescription_str = """
+name: PseudonymUnit
+type: pseudonym
+should_include:
+  times: 1
+  adviser_pipeline: true
+match:
+  package_version:
+    name: tensorflow-cpu
+    index_url: 'https://pypi.org/simple'
+run:
+  yield:
+    package_version:
+      name: intel-tensorflow
+      locked_version: ==2.4.0
+      index_url: 'https://pypi.org/simple'
+"""
+        PseudonymPrescription.set_prescription(load_prescription(PRESCRIPTION_PSEUDONYM_SCHEMA, prescription_str))
+
+        package_version = PackageVersion(
+            name="tensorflow-cpu",
+            version="==2.4.0",
+            index=Source("https://pypi.org/simple"),
+            develop=False,
+        )
+
+        expected_result = [("intel-tensorflow", "2.4.0", "https://pypi.org/simple")]
+        context.graph.should_receive("get_solved_python_package_versions_all").with_args(
+            package_name="intel-tensorflow",
+            package_version="2.4.0",
+            index_url="https://pypi.org/simple",
+            count=None,
+            os_name=context.project.runtime_environment.operating_system.name,
+            os_version=context.project.runtime_environment.operating_system.version,
+            python_version=context.project.runtime_environment.python_version,
+            distinct=True,
+            is_missing=False,
+        ).and_return(expected_result).once()
+
+        unit = PseudonymPrescription()
+        unit.pre_run()
+        with unit.assigned_context(context):
+            assert list(unit.run(package_version=package_version)) == expected_result
+            assert list(unit.run(package_version=package_version)) == expected_result
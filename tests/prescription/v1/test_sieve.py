@@ -19,7 +19,6 @@
 
 import flexmock
 import pytest
-import yaml
 
 from thoth.adviser.context import Context
 from thoth.adviser.prescription.v1 import SievePrescription
@@ -28,6 +27,7 @@ from thoth.python import PackageVersion
 from thoth.python import Source
 
 from .base import AdviserUnitPrescriptionTestCase
+from .base import load_prescription
 
 
 class TestSievePrescription(AdviserUnitPrescriptionTestCase):
@@ -52,9 +52,7 @@ run:
       message: Some stack warning message printed by a sieve
       link: https://thoth-station.ninja
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_SIEVE_SCHEMA(prescription)
-        SievePrescription.set_prescription(prescription)
+        SievePrescription.set_prescription(load_prescription(PRESCRIPTION_SIEVE_SCHEMA, prescription_str))
         package_version = PackageVersion(
             name="flask",
             version="==1.1.0",
@@ -83,9 +81,7 @@ run:
     message: Some stack warning message printed by a sieve
     type: {log_level}
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_SIEVE_SCHEMA(prescription)
-        SievePrescription.set_prescription(prescription)
+        SievePrescription.set_prescription(load_prescription(PRESCRIPTION_SIEVE_SCHEMA, prescription_str))
         package_version = PackageVersion(
             name="flask",
             version="==1.1.0",
@@ -109,9 +105,7 @@ match:
     name: flask
     version: '<=1.1.0'
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_SIEVE_SCHEMA(prescription)
-        SievePrescription.set_prescription(prescription)
+        SievePrescription.set_prescription(load_prescription(PRESCRIPTION_SIEVE_SCHEMA, prescription_str))
         package_versions = [
             PackageVersion(
                 name="flask",
@@ -155,9 +149,7 @@ match:
     version: '<=1.1.0'
 """
         flexmock(SievePrescription).should_receive("_should_include_base").replace_with(lambda _: True).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_SIEVE_SCHEMA(prescription)
-        SievePrescription.set_prescription(prescription)
+        SievePrescription.set_prescription(load_prescription(PRESCRIPTION_SIEVE_SCHEMA, prescription_str))
 
         builder_context = flexmock()
         assert list(SievePrescription.should_include(builder_context)) == [
@@ -189,9 +181,7 @@ match:
       name: numpy
 """
         flexmock(SievePrescription).should_receive("_should_include_base").replace_with(lambda _: True).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_SIEVE_SCHEMA(prescription)
-        SievePrescription.set_prescription(prescription)
+        SievePrescription.set_prescription(load_prescription(PRESCRIPTION_SIEVE_SCHEMA, prescription_str))
 
         builder_context = flexmock()
         assert list(SievePrescription.should_include(builder_context)) == [
@@ -229,9 +219,7 @@ match:
     index_url: https://pypi.org/simple
 """
         flexmock(SievePrescription).should_receive("_should_include_base").replace_with(lambda _: True).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_SIEVE_SCHEMA(prescription)
-        SievePrescription.set_prescription(prescription)
+        SievePrescription.set_prescription(load_prescription(PRESCRIPTION_SIEVE_SCHEMA, prescription_str))
 
         builder_context = flexmock()
         assert list(SievePrescription.should_include(builder_context)) == [
@@ -260,9 +248,7 @@ match:
     version: '<=1.1.0'
 """
         flexmock(SievePrescription).should_receive("_should_include_base").replace_with(lambda _: False).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_SIEVE_SCHEMA(prescription)
-        SievePrescription.set_prescription(prescription)
+        SievePrescription.set_prescription(load_prescription(PRESCRIPTION_SIEVE_SCHEMA, prescription_str))
 
         builder_context = flexmock()
         assert list(SievePrescription.should_include(builder_context)) == []
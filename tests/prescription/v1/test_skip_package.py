@@ -17,7 +17,6 @@
 
 """Test implementation of skip package sieve."""
 
-import yaml
 
 from flexmock import flexmock
 import pytest
@@ -29,6 +28,7 @@ from thoth.adviser.prescription.v1 import SkipPackageSievePrescription
 from thoth.adviser.prescription.v1.schema import PRESCRIPTION_SKIP_PACKAGE_SIEVE_SCHEMA
 
 from .base import AdviserUnitPrescriptionTestCase
+from .base import load_prescription
 
 
 class TestSkipPackageSievePrescription(AdviserUnitPrescriptionTestCase):
@@ -52,9 +52,9 @@ run:
     message: Skip package info message
     type: INFO
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_SKIP_PACKAGE_SIEVE_SCHEMA(prescription)
-        SkipPackageSievePrescription.set_prescription(prescription)
+        SkipPackageSievePrescription.set_prescription(
+            load_prescription(PRESCRIPTION_SKIP_PACKAGE_SIEVE_SCHEMA, prescription_str)
+        )
 
         context.stack_info.clear()
 
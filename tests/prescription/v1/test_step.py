@@ -19,7 +19,6 @@
 
 import flexmock
 import pytest
-import yaml
 
 from thoth.adviser.context import Context
 from thoth.adviser.state import State
@@ -29,14 +28,11 @@ from thoth.python import PackageVersion
 from thoth.python import Source
 
 from .base import AdviserUnitPrescriptionTestCase
+from .base import load_prescription
 
 
-class TestStepPrescription(AdviserUnitPrescriptionTestCase):
-    """Tests related to step prescription v1."""
-
-    def test_run_stack_info(self, context: Context, state: State) -> None:
-        """Check assigning stack info."""
-        prescription_str = """
+_PRESCRIPTION_SOURCES = {
+    "stack_info": """
 name: StepUnit
 type: step
 should_include:
@@ -50,10 +46,126 @@ run:
     - type: WARNING
       message: Some message
       link: https://thoth-station.ninja
-"""
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STEP_SCHEMA(prescription)
-        StepPrescription.set_prescription(prescription)
+""",
+    "eager_stop_pipeline": """
+name: StepUnit
+type: step
+should_include:
+  times: 1
+  dependency_monkey_pipeline: true
+match:
+  package_version:
+    name: flask
+    version: "<1.0.0"
+run:
+  eager_stop_pipeline: This is exception message reported
+""",
+    "not_acceptable": """
+name: StepUnit
+type: step
+should_include:
+  times: 1
+  adviser_pipeline: true
+  dependency_monkey_pipeline: true
+match:
+  package_version:
+      name: flask
+      version: "~=0.0"
+      index_url: "https://pypi.org/simple"
+run:
+  not_acceptable: This is exception message reported
+""",
+    "score_justification": """
+name: StepUnit
+type: step
+should_include:
+  times: 1
+  adviser_pipeline: true
+match:
+  package_version:
+    name: pysaml2
+    version: '<6.5.0'
+    index_url: 'https://pypi.org/simple'
+run:
+  score: -0.1
+  justification:
+    - type: WARNING
+      message: CVE found for pysaml2
+      link: cve_pysaml2
+    - type: INFO
+      message: Package pysaml2 was removed from software stack resolution
+      link: https://example.com
+""",
+    "state": """
+name: StepUnit
+type: step
+should_include:
+  times: 1
+  adviser_pipeline: true
+match:
+  package_version:
+    name: numpy
+    version: '==1.19.1'
+    index_url: 'https://pypi.org/simple'
+  state:
+    resolved_dependencies:
+      - name: tensorflow
+        version: '~=2.4.0'
+run:
+  score: 0.5
+""",
+    "package_name": """
+name: StepUnit
+type: step
+should_include:
+  times: 1
+  adviser_pipeline: true
+match:
+  package_version:
+    name: numpy
+    version: '==1.19.1'
+    index_url: 'https://pypi.org/simple'
+run:
+  multi_package_resolution: true
+  score: 0.1
+""",
+    "index_url": """
+name: StepUnit
+type: step
+should_include:
+  times: 1
+  adviser_pipeline: true
+match:
+  package_version:
+    index_url: 'https://thoth-station.ninja'
+run:
+  score: 0.1
+""",
+    "multi": """
+name: StepUnit
+type: step
+should_include:
+  times: 1
+  adviser_pipeline: true
+match:
+  - package_version:
+      index_url: 'https://thoth-station.ninja'
+  - package_version:
+      name: flask
+run:
+  score: 0.1
+""",
+}
+
+
+class TestStepPrescription(AdviserUnitPrescriptionTestCase):
+    """Tests related to step prescription v1."""
+
+    def test_run_stack_info(self, context: Context, state: State) -> None:
+        """Check assigning stack info."""
+        StepPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_STEP_SCHEMA, _PRESCRIPTION_SOURCES["stack_info"])
+        )
         package_version = PackageVersion(
             name="flask",
             version="==1.1.0",
@@ -80,9 +192,7 @@ run:
     message: Seen flask during resolution
     type: {log_level}
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STEP_SCHEMA(prescription)
-        StepPrescription.set_prescription(prescription)
+        StepPrescription.set_prescription(load_prescription(PRESCRIPTION_STEP_SCHEMA, prescription_str))
         package_version = PackageVersion(
             name="flask",
             version="==1.1.0",
@@ -93,22 +203,9 @@ run:
 
     def test_run_eager_stop_pipeline(self, context: Context, state: State) -> None:
         """Check eager stop pipeline configuration."""
-        prescription_str = """
-name: StepUnit
-type: step
-should_include:
-  times: 1
-  dependency_monkey_pipeline: true
-match:
-  package_version:
-    name: flask
-    version: "<1.0.0"
-run:
-  eager_stop_pipeline: This is exception message reported
-"""
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STEP_SCHEMA(prescription)
-        StepPrescription.set_prescription(prescription)
+        StepPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_STEP_SCHEMA, _PRESCRIPTION_SOURCES["eager_stop_pipeline"])
+        )
         package_version = PackageVersion(
             name="flask",
             version="==0.12",
@@ -119,24 +216,9 @@ run:
 
     def test_run_not_acceptable(self, context: Context, state: State) -> None:
         """Check raising not acceptable."""
-        prescription_str = """
-name: StepUnit
-type: step
-should_include:
-  times: 1
-  adviser_pipeline: true
-  dependency_monkey_pipeline: true
-match:
-  package_version:
-      name: flask
-      version: "~=0.0"
-      index_url: "https://pypi.org/simple"
-run:
-  not_acceptable: This is exception message reported
-"""
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STEP_SCHEMA(prescription)
-        StepPrescription.set_prescription(prescription)
+        StepPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_STEP_SCHEMA, _PRESCRIPTION_SOURCES["not_acceptable"])
+        )
         package_version = PackageVersion(
             name="flask",
             version="==0.12",
@@ -147,30 +229,9 @@ run:
 
     def test_run(self, context: Context, state: State) -> None:
         """Check running the step with score and justification."""
-        prescription_str = """
-name: StepUnit
-type: step
-should_include:
-  times: 1
-  adviser_pipeline: true
-match:
-  package_version:
-    name: pysaml2
-    version: '<6.5.0'
-    index_url: 'https://pypi.org/simple'
-run:
-  score: -0.1
-  justification:
-    - type: WARNING
-      message: CVE found for pysaml2
-      link: cve_pysaml2
-    - type: INFO
-      message: Package pysaml2 was removed from software stack resolution
-      link: https://example.com
-"""
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STEP_SCHEMA(prescription)
-        StepPrescription.set_prescription(prescription)
+        StepPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_STEP_SCHEMA, _PRESCRIPTION_SOURCES["score_justification"])
+        )
         package_version = PackageVersion(
             name="pysaml2",
             version="==6.4.0",
@@ -190,27 +251,7 @@ run:
 
     def test_run_state(self, context: Context, state: State) -> None:
         """Test running the prescription if state matches."""
-        prescription_str = """
-name: StepUnit
-type: step
-should_include:
-  times: 1
-  adviser_pipeline: true
-match:
-  package_version:
-    name: numpy
-    version: '==1.19.1'
-    index_url: 'https://pypi.org/simple'
-  state:
-    resolved_dependencies:
-      - name: tensorflow
-        version: '~=2.4.0'
-run:
-  score: 0.5
-"""
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STEP_SCHEMA(prescription)
-        StepPrescription.set_prescription(prescription)
+        StepPrescription.set_prescription(load_prescription(PRESCRIPTION_STEP_SCHEMA, _PRESCRIPTION_SOURCES["state"]))
         package_version = PackageVersion(
             name="numpy",
             version="==1.19.1",
@@ -231,27 +272,7 @@ run:
 
     def test_run_state_no_match(self, context: Context, state: State) -> None:
         """Test running the prescription if state matches."""
-        prescription_str = """
-name: StepUnit
-type: step
-should_include:
-  times: 1
-  adviser_pipeline: true
-match:
-  package_version:
-    name: numpy
-    version: '==1.19.1'
-    index_url: 'https://pypi.org/simple'
-  state:
-    resolved_dependencies:
-      - name: tensorflow
-        version: '~=2.4.0'
-run:
-  score: 0.5
-"""
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STEP_SCHEMA(prescription)
-        StepPrescription.set_prescription(prescription)
+        StepPrescription.set_prescription(load_prescription(PRESCRIPTION_STEP_SCHEMA, _PRESCRIPTION_SOURCES["state"]))
         package_version = PackageVersion(
             name="numpy",
             version="==1.19.1",
@@ -270,25 +291,10 @@ run:
 
     def test_should_include_package_name(self) -> None:
         """Test including this pipeline unit."""
-        prescription_str = """
-name: StepUnit
-type: step
-should_include:
-  times: 1
-  adviser_pipeline: true
-match:
-  package_version:
-    name: numpy
-    version: '==1.19.1'
-    index_url: 'https://pypi.org/simple'
-run:
-  multi_package_resolution: true
-  score: 0.1
-"""
         flexmock(StepPrescription).should_receive("_should_include_base").replace_with(lambda _: True).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STEP_SCHEMA(prescription)
-        StepPrescription.set_prescription(prescription)
+        StepPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_STEP_SCHEMA, _PRESCRIPTION_SOURCES["package_name"])
+        )
 
         builder_context = flexmock()
         assert list(StepPrescription.should_include(builder_context)) == [
@@ -311,22 +317,10 @@ run:
 
     def test_should_include_no_package_name(self) -> None:
         """Test including this pipeline unit."""
-        prescription_str = """
-name: StepUnit
-type: step
-should_include:
-  times: 1
-  adviser_pipeline: true
-match:
-  package_version:
-    index_url: 'https://thoth-station.ninja'
-run:
-  score: 0.1
-"""
         flexmock(StepPrescription).should_receive("_should_include_base").replace_with(lambda _: True).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STEP_SCHEMA(prescription)
-        StepPrescription.set_prescription(prescription)
+        StepPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_STEP_SCHEMA, _PRESCRIPTION_SOURCES["index_url"])
+        )
 
         builder_context = flexmock()
         assert list(StepPrescription.should_include(builder_context)) == [
@@ -346,24 +340,8 @@ run:
 
     def test_should_include_multi(self) -> None:
         """Test including this pipeline unit multiple times."""
-        prescription_str = """
-name: StepUnit
-type: step
-should_include:
-  times: 1
-  adviser_pipeline: true
-match:
-  - package_version:
-      index_url: 'https://thoth-station.ninja'
-  - package_version:
-      name: flask
-run:
-  score: 0.1
-"""
         flexmock(StepPrescription).should_receive("_should_include_base").replace_with(lambda _: True).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STEP_SCHEMA(prescription)
-        StepPrescription.set_prescription(prescription)
+        StepPrescription.set_prescription(load_prescription(PRESCRIPTION_STEP_SCHEMA, _PRESCRIPTION_SOURCES["multi"]))
 
         builder_context = flexmock()
         assert list(StepPrescription.should_include(builder_context)) == [
@@ -395,22 +373,10 @@ run:
 
     def test_no_should_include(self) -> None:
         """Test not including this pipeline."""
-        prescription_str = """
-name: StepUnit
-type: step
-should_include:
-  times: 1
-  adviser_pipeline: true
-match:
-  package_version:
-    index_url: 'https://thoth-station.ninja'
-run:
-  score: 0.1
-"""
         flexmock(StepPrescription).should_receive("_should_include_base").replace_with(lambda _: False).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STEP_SCHEMA(prescription)
-        StepPrescription.set_prescription(prescription)
+        StepPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_STEP_SCHEMA, _PRESCRIPTION_SOURCES["index_url"])
+        )
 
         builder_context = flexmock()
         assert list(StepPrescription.should_include(builder_context)) == []
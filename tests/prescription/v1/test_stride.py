@@ -19,7 +19,6 @@
 
 import flexmock
 import pytest
-import yaml
 
 from thoth.adviser.context import Context
 from thoth.adviser.state import State
@@ -27,6 +26,7 @@ from thoth.adviser.prescription.v1 import StridePrescription
 from thoth.adviser.prescription.v1.schema import PRESCRIPTION_STRIDE_SCHEMA
 
 from .base import AdviserUnitPrescriptionTestCase
+from .base import load_prescription
 
 
 class TestStridePrescription(AdviserUnitPrescriptionTestCase):
@@ -52,9 +52,7 @@ run:
       message: Some message
       link: https://pypi.org/project/werkzeug
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STRIDE_SCHEMA(prescription)
-        StridePrescription.set_prescription(prescription)
+        StridePrescription.set_prescription(load_prescription(PRESCRIPTION_STRIDE_SCHEMA, prescription_str))
         state.add_resolved_dependency(("werkzeug", "0.5.0", "https://pypi.org/simple"))
         self.check_run_stack_info(context, StridePrescription, state=state)
 
@@ -76,9 +74,7 @@ run:
     message: Seen flask in one of the resolved stacks
     type: {log_level}
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STRIDE_SCHEMA(prescription)
-        StridePrescription.set_prescription(prescription)
+        StridePrescription.set_prescription(load_prescription(PRESCRIPTION_STRIDE_SCHEMA, prescription_str))
         state.add_resolved_dependency(("flask", "0.12", "https://pypi.org/simple"))
         self.check_run_log(caplog, context, log_level, StridePrescription, state=state)
 
@@ -102,9 +98,7 @@ match:
 run:
   eager_stop_pipeline: These three cannot occur together
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STRIDE_SCHEMA(prescription)
-        StridePrescription.set_prescription(prescription)
+        StridePrescription.set_prescription(load_prescription(PRESCRIPTION_STRIDE_SCHEMA, prescription_str))
         state.add_resolved_dependency(("flask", "0.12.0", "https://pypi.org/simple"))
         state.add_resolved_dependency(("werkzeug", "1.0.1", "https://pypi.org/simple"))
         state.add_resolved_dependency(("itsdangerous", "0.5.1", "https://pypi.org/simple"))
@@ -130,9 +124,7 @@ match:
 run:
   not_acceptable: This is exception message reported
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STRIDE_SCHEMA(prescription)
-        StridePrescription.set_prescription(prescription)
+        StridePrescription.set_prescription(load_prescription(PRESCRIPTION_STRIDE_SCHEMA, prescription_str))
         state.add_resolved_dependency(("flask", "0.12", "https://pypi.org/simple"))
         state.add_resolved_dependency(("connexion", "2.7.0", "https://pypi.org/simple"))
         self.check_run_not_acceptable(context, StridePrescription, state=state)
@@ -160,9 +152,7 @@ run:
       message: This message will not be shown
       link: https://pypi.org/project/connexion
 """
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STRIDE_SCHEMA(prescription)
-        StridePrescription.set_prescription(prescription)
+        StridePrescription.set_prescription(load_prescription(PRESCRIPTION_STRIDE_SCHEMA, prescription_str))
         state.add_resolved_dependency(("flask", "0.12", "https://pypi.org/simple"))
         state.add_resolved_dependency(("connexion", "2.0.0", "https://pypi.org/simple"))
 
@@ -196,9 +186,7 @@ run:
       link: https://pypi.org/project/connexion
 """
         flexmock(StridePrescription).should_receive("_should_include_base").replace_with(lambda _: True).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STRIDE_SCHEMA(prescription)
-        StridePrescription.set_prescription(prescription)
+        StridePrescription.set_prescription(load_prescription(PRESCRIPTION_STRIDE_SCHEMA, prescription_str))
 
         builder_context = flexmock()
         assert list(StridePrescription.should_include(builder_context)) == [
@@ -249,9 +237,7 @@ run:
       link: https://pypi.org/project/flask
 """
         flexmock(StridePrescription).should_receive("_should_include_base").replace_with(lambda _: True).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STRIDE_SCHEMA(prescription)
-        StridePrescription.set_prescription(prescription)
+        StridePrescription.set_prescription(load_prescription(PRESCRIPTION_STRIDE_SCHEMA, prescription_str))
 
         builder_context = flexmock()
         assert list(StridePrescription.should_include(builder_context)) == [
@@ -320,9 +306,7 @@ run:
       link: https://pypi.org/project/connexion
 """
         flexmock(StridePrescription).should_receive("_should_include_base").replace_with(lambda _: False).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_STRIDE_SCHEMA(prescription)
-        StridePrescription.set_prescription(prescription)
+        StridePrescription.set_prescription(load_prescription(PRESCRIPTION_STRIDE_SCHEMA, prescription_str))
 
         builder_context = flexmock()
         assert list(StridePrescription.should_include(builder_context)) == []
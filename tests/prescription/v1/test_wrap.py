@@ -19,7 +19,6 @@
 
 import flexmock
 import pytest
-import yaml
 
 from thoth.adviser.context import Context
 from thoth.adviser.state import State
@@ -27,14 +26,11 @@ from thoth.adviser.prescription.v1 import WrapPrescription
 from thoth.adviser.prescription.v1.schema import PRESCRIPTION_WRAP_SCHEMA
 
 from .base import AdviserUnitPrescriptionTestCase
+from .base import load_prescription
 
 
-class TestWrapPrescription(AdviserUnitPrescriptionTestCase):
-    """Tests related to wrap prescription v1."""
-
-    def test_run_stack_info(self, context: Context, state: State) -> None:
-        """Check assigning stack info."""
-        prescription_str = """
+_PRESCRIPTION_SOURCES = {
+    "stack_info": """
 name: WrapUnit
 type: wrap
 should_include:
@@ -51,17 +47,8 @@ run:
     - type: WARNING
       message: Some message
       link: https://pypi.org/project/werkzeug
-"""
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_WRAP_SCHEMA(prescription)
-        WrapPrescription.set_prescription(prescription)
-        state.add_resolved_dependency(("werkzeug", "0.5.0", "https://pypi.org/simple"))
-        self.check_run_stack_info(context, WrapPrescription, state=state)
-
-    @pytest.mark.parametrize("log_level", ["INFO", "ERROR", "WARNING"])
-    def test_run_log(self, caplog, context: Context, state: State, log_level: str) -> None:
-        """Check logging messages."""
-        prescription_str = f"""
+""",
+    "log": """
 name: WrapUnit
 type: wrap
 should_include:
@@ -75,16 +62,8 @@ run:
   log:
     message: Seen flask in one of the resolved stacks
     type: {log_level}
-"""
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_WRAP_SCHEMA(prescription)
-        WrapPrescription.set_prescription(prescription)
-        state.add_resolved_dependency(("flask", "0.12", "https://pypi.org/simple"))
-        self.check_run_log(caplog, context, log_level, WrapPrescription, state=state)
-
-    def test_run_eager_stop_pipeline(self, context: Context, state: State) -> None:
-        """Check eager stop pipeline configuration."""
-        prescription_str = """
+""",
+    "eager_stop_pipeline": """
 name: WrapUnit
 type: wrap
 should_include:
@@ -101,18 +80,8 @@ match:
       version: <1.0
 run:
   eager_stop_pipeline: These three cannot occur together
-"""
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_WRAP_SCHEMA(prescription)
-        WrapPrescription.set_prescription(prescription)
-        state.add_resolved_dependency(("flask", "0.12.0", "https://pypi.org/simple"))
-        state.add_resolved_dependency(("werkzeug", "1.0.1", "https://pypi.org/simple"))
-        state.add_resolved_dependency(("itsdangerous", "0.5.1", "https://pypi.org/simple"))
-        self.check_run_eager_stop_pipeline(context, WrapPrescription, state=state)
-
-    def test_run_not_acceptable(self, context: Context, state: State) -> None:
-        """Check raising not acceptable."""
-        prescription_str = """
+""",
+    "not_acceptable": """
 name: WrapUnit
 type: wrap
 should_include:
@@ -129,17 +98,8 @@ match:
         index_url: "https://pypi.org/simple"
 run:
   not_acceptable: This is exception message reported
-"""
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_WRAP_SCHEMA(prescription)
-        WrapPrescription.set_prescription(prescription)
-        state.add_resolved_dependency(("flask", "0.12", "https://pypi.org/simple"))
-        state.add_resolved_dependency(("connexion", "2.7.0", "https://pypi.org/simple"))
-        self.check_run_not_acceptable(context, WrapPrescription, state=state)
-
-    def test_run_no_match(self, context: Context, state: State) -> None:
-        """Test running this pipeline unit without match."""
-        prescription_str = """
+""",
+    "no_match": """
 name: WrapUnit
 type: wrap
 should_include:
@@ -159,25 +119,8 @@ run:
     - type: ERROR
       message: This message will not be shown
       link: https://pypi.org/project/connexion
-"""
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_WRAP_SCHEMA(prescription)
-        WrapPrescription.set_prescription(prescription)
-        state.add_resolved_dependency(("flask", "0.12", "https://pypi.org/simple"))
-        state.add_resolved_dependency(("connexion", "2.0.0", "https://pypi.org/simple"))
-
-        assert not context.stack_info
-
-        unit = WrapPrescription()
-        unit.pre_run()
-        with unit.assigned_context(context):
-            assert unit.run(state) is None
-
-        assert not context.stack_info
-
-    def test_run_justification(self, context: Context, state: State) -> None:
-        """Test running this pipeline unit without match."""
-        prescription_str = """
+""",
+    "justification": """
 name: WrapUnit
 type: wrap
 should_include:
@@ -197,25 +140,8 @@ run:
     - type: ERROR
       message: This message will not be shown
       link: https://pypi.org/project/connexion
-"""
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_WRAP_SCHEMA(prescription)
-        WrapPrescription.set_prescription(prescription)
-        state.add_resolved_dependency(("flask", "0.12", "https://pypi.org/simple"))
-        state.add_resolved_dependency(("connexion", "2.7.0", "https://pypi.org/simple"))
-
-        state.justification.clear()
-
-        unit = WrapPrescription()
-        unit.pre_run()
-        with unit.assigned_context(context):
-            assert unit.run(state) is None
-
-        assert state.justification == unit.run_prescription["justification"]
-
-    def test_should_include(self) -> None:
-        """Test including this pipeline unit."""
-        prescription_str = """
+""",
+    "should_include": """
 name: WrapUnit
 type: wrap
 should_include:
@@ -232,11 +158,159 @@ run:
     - type: ERROR
       message: This message will not be shown
       link: https://pypi.org/project/connexion
-"""
+""",
+    "should_include_multi": """
+name: WrapUnit
+type: wrap
+should_include:
+  times: 1
+  adviser_pipeline: true
+match:
+  - state:
+      resolved_dependencies:
+        - name: tensorflow-cpu
+  - state:
+      resolved_dependencies:
+        - name: tensorflow
+  - state:
+      resolved_dependencies:
+        - name: intel-tensorflow
+run:
+  justification:
+    - type: ERROR
+      message: This message will be shown
+      link: https://pypi.org/project/tensorflow
+""",
+    "no_package_name": """
+name: WrapUnit
+type: wrap
+should_include:
+  times: 1
+  adviser_pipeline: true
+run:
+  justification:
+    - type: ERROR
+      message: This message will not be shown
+      link: https://pypi.org/project/connexion
+""",
+    "advised_manifest_changes": """
+name: WrapUnit
+type: wrap
+should_include:
+  times: 1
+  adviser_pipeline: true
+match:
+  state:
+    resolved_dependencies:
+      - name: intel-tensorflow
+run:
+  advised_manifest_changes:
+    apiVersion: apps.openshift.io/v1
+    kind: DeploymentConfig
+    patch:
+      op: add
+      path: /spec/template/spec/containers/0/env/0
+      value:
+        name: OMP_NUM_THREADS
+        value: "1"
+""",
+}
+
+
+class TestWrapPrescription(AdviserUnitPrescriptionTestCase):
+    """Tests related to wrap prescription v1."""
+
+    def test_run_stack_info(self, context: Context, state: State) -> None:
+        """Check assigning stack info."""
+        WrapPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_WRAP_SCHEMA, _PRESCRIPTION_SOURCES["stack_info"])
+        )
+        state.add_resolved_dependency(("werkzeug", "0.5.0", "https://pypi.org/simple"))
+        self.check_run_stack_info(context, WrapPrescription, state=state)
+
+    @pytest.mark.parametrize("log_level", ["INFO", "ERROR", "WARNING"])
+    def test_run_log(self, caplog, context: Context, state: State, log_level: str) -> None:
+        """Check logging messages."""
+        prescription_str = _PRESCRIPTION_SOURCES["log"].format(log_level=log_level)
+        WrapPrescription.set_prescription(load_prescription(PRESCRIPTION_WRAP_SCHEMA, prescription_str))
+        state.add_resolved_dependency(("flask", "0.12", "https://pypi.org/simple"))
+        self.check_run_log(caplog, context, log_level, WrapPrescription, state=state)
+
+    def test_run_eager_stop_pipeline(self, context: Context, state: State) -> None:
+        """Check eager stop pipeline configuration."""
+        WrapPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_WRAP_SCHEMA, _PRESCRIPTION_SOURCES["eager_stop_pipeline"])
+        )
+        state.add_resolved_dependencies(
+            [
+                ("flask", "0.12.0", "https://pypi.org/simple"),
+                ("werkzeug", "1.0.1", "https://pypi.org/simple"),
+                ("itsdangerous", "0.5.1", "https://pypi.org/simple"),
+            ]
+        )
+        self.check_run_eager_stop_pipeline(context, WrapPrescription, state=state)
+
+    def test_run_not_acceptable(self, context: Context, state: State) -> None:
+        """Check raising not acceptable."""
+        WrapPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_WRAP_SCHEMA, _PRESCRIPTION_SOURCES["not_acceptable"])
+        )
+        state.add_resolved_dependencies(
+            [
+                ("flask", "0.12", "https://pypi.org/simple"),
+                ("connexion", "2.7.0", "https://pypi.org/simple"),
+            ]
+        )
+        self.check_run_not_acceptable(context, WrapPrescription, state=state)
+
+    def test_run_no_match(self, context: Context, state: State) -> None:
+        """Test running this pipeline unit without match."""
+        WrapPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_WRAP_SCHEMA, _PRESCRIPTION_SOURCES["no_match"])
+        )
+        state.add_resolved_dependencies(
+            [
+                ("flask", "0.12", "https://pypi.org/simple"),
+                ("connexion", "2.0.0", "https://pypi.org/simple"),
+            ]
+        )
+
+        assert not context.stack_info
+
+        unit = WrapPrescription()
+        unit.pre_run()
+        with unit.assigned_context(context):
+            assert unit.run(state) is None
+
+        assert not context.stack_info
+
+    def test_run_justification(self, context: Context, state: State) -> None:
+        """Test running this pipeline unit without match."""
+        WrapPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_WRAP_SCHEMA, _PRESCRIPTION_SOURCES["justification"])
+        )
+        state.add_resolved_dependencies(
+            [
+                ("flask", "0.12", "https://pypi.org/simple"),
+                ("connexion", "2.7.0", "https://pypi.org/simple"),
+            ]
+        )
+
+        state.justification.clear()
+
+        unit = WrapPrescription()
+        unit.pre_run()
+        with unit.assigned_context(context):
+            assert unit.run(state) is None
+
+        assert state.justification == unit.run_prescription["justification"]
+
+    def test_should_include(self) -> None:
+        """Test including this pipeline unit."""
         flexmock(WrapPrescription).should_receive("_should_include_base").replace_with(lambda _: True).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_WRAP_SCHEMA(prescription)
-        WrapPrescription.set_prescription(prescription)
+        WrapPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_WRAP_SCHEMA, _PRESCRIPTION_SOURCES["should_include"])
+        )
 
         builder_context = flexmock()
         assert list(WrapPrescription.should_include(builder_context)) == [
@@ -267,32 +341,10 @@ run:
 
     def test_should_include_multi(self) -> None:
         """Test including this pipeline unit multiple times."""
-        prescription_str = """
-name: WrapUnit
-type: wrap
-should_include:
-  times: 1
-  adviser_pipeline: true
-match:
-  - state:
-      resolved_dependencies:
-        - name: tensorflow-cpu
-  - state:
-      resolved_dependencies:
-        - name: tensorflow
-  - state:
-      resolved_dependencies:
-        - name: intel-tensorflow
-run:
-  justification:
-    - type: ERROR
-      message: This message will be shown
-      link: https://pypi.org/project/tensorflow
-"""
         flexmock(WrapPrescription).should_receive("_should_include_base").replace_with(lambda _: True).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_WRAP_SCHEMA(prescription)
-        WrapPrescription.set_prescription(prescription)
+        WrapPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_WRAP_SCHEMA, _PRESCRIPTION_SOURCES["should_include_multi"])
+        )
 
         builder_context = flexmock()
         assert list(WrapPrescription.should_include(builder_context)) == [
@@ -363,22 +415,10 @@ run:
 
     def test_should_include_no_package_name(self) -> None:
         """Test including this pipeline unit without any specific resolved package."""
-        prescription_str = """
-name: WrapUnit
-type: wrap
-should_include:
-  times: 1
-  adviser_pipeline: true
-run:
-  justification:
-    - type: ERROR
-      message: This message will not be shown
-      link: https://pypi.org/project/connexion
-"""
         flexmock(WrapPrescription).should_receive("_should_include_base").replace_with(lambda _: True).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_WRAP_SCHEMA(prescription)
-        WrapPrescription.set_prescription(prescription)
+        WrapPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_WRAP_SCHEMA, _PRESCRIPTION_SOURCES["no_package_name"])
+        )
 
         builder_context = flexmock()
         assert list(WrapPrescription.should_include(builder_context)) == [
@@ -399,58 +439,19 @@ run:
 
     def test_no_should_include(self) -> None:
         """Test not including this pipeline unit."""
-        prescription_str = """
-name: WrapUnit
-type: wrap
-should_include:
-  times: 1
-  adviser_pipeline: true
-match:
-  state:
-    resolved_dependencies:
-      - name: flask
-        version: "<=1.0.0,>=0.12"
-        index_url: "https://pypi.org/simple"
-run:
-  justification:
-    - type: ERROR
-      message: This message will not be shown
-      link: https://pypi.org/project/connexion
-"""
         flexmock(WrapPrescription).should_receive("_should_include_base").replace_with(lambda _: False).once()
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_WRAP_SCHEMA(prescription)
-        WrapPrescription.set_prescription(prescription)
+        WrapPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_WRAP_SCHEMA, _PRESCRIPTION_SOURCES["should_include"])
+        )
 
         builder_context = flexmock()
         assert list(WrapPrescription.should_include(builder_context)) == []
 
     def test_advised_manifest_changes(self, state: State, context: Context) -> None:
         """Test advising changes in the manifest files."""
-        prescription_str = """
-name: WrapUnit
-type: wrap
-should_include:
-  times: 1
-  adviser_pipeline: true
-match:
-  state:
-    resolved_dependencies:
-      - name: intel-tensorflow
-run:
-  advised_manifest_changes:
-    apiVersion: apps.openshift.io/v1
-    kind: DeploymentConfig
-    patch:
-      op: add
-      path: /spec/template/spec/containers/0/env/0
-      value:
-        name: OMP_NUM_THREADS
-        value: "1"
-"""
-        prescription = yaml.safe_load(prescription_str)
-        PRESCRIPTION_WRAP_SCHEMA(prescription)
-        WrapPrescription.set_prescription(prescription)
+        WrapPrescription.set_prescription(
+            load_prescription(PRESCRIPTION_WRAP_SCHEMA, _PRESCRIPTION_SOURCES["advised_manifest_changes"])
+        )
         state.add_resolved_dependency(("intel-tensorflow", "2.2.0", "https://pypi.org/simple"))
 
         state.justification.clear()
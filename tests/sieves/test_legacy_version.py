@@ -17,6 +17,8 @@
 
 """Test removing legacy versions from the resolution process."""
 
+import logging
+
 from thoth.adviser.context import Context
 from thoth.adviser.sieves import LegacyVersionSieve
 from thoth.adviser.enums import RecommendationType
@@ -78,3 +80,48 @@ class TestLegacyVersionSieve(AdviserUnitTestCase):
         with self.UNIT_TESTED.assigned_context(context):
             sieve = self.UNIT_TESTED()
             assert list(sieve.run(p for p in [pv1])) == []
+
+    def test_remove_legacy_version_log(self, caplog, context: Context) -> None:
+        """Test reporting removed legacy versions once."""
+        pv1 = PackageVersion(
+            name="flask",
+            version="==foo",
+            index=Source("https://pypi.org/simple"),
+            develop=False,
+        )
+        pv2 = PackageVersion(
+            name="flask",
+            version="==1.0.0",
+            index=pv1.index,
+            develop=False,
+        )
+
+        with self.UNIT_TESTED.assigned_context(context):
+            sieve = self.UNIT_TESTED()
+            sieve.pre_run()
+            assert list(sieve.run(p for p in [pv1, pv2, pv1])) == [pv2]
+
+        assert len([r for r in caplog.records if r.levelno == logging.WARNING]) == 1
+
+    def test_remove_legacy_version_no_log(self, caplog, context: Context) -> None:
+        """Test removing legacy versions when warnings are not reported."""
+        pv1 = PackageVersion(
+            name="flask",
+            version="==foo",
+            index=Source("https://pypi.org/simple"),
+            develop=False,
+        )
+        pv2 = PackageVersion(
+            name="flask",
+            version="==1.0.0",
+            index=pv1.index,
+            develop=False,
+        )
+
+        caplog.set_level(logging.ERROR, logger="thoth.adviser.sieves.legacy_version")
+        with self.UNIT_TESTED.assigned_context(context):
+            sieve = self.UNIT_TESTED()
+            sieve.pre_run()
+            assert list(sieve.run(p for p in [pv1, pv2])) == [pv2]
+
+        assert not caplog.records
@@ -66,6 +66,24 @@ class TestState(AdviserTestCase):
         final_state.unresolved_dependencies.pop("selinon")
         assert final_state.is_final()
 
+    def test_add_resolved_dependencies(self, final_state: State) -> None:
+        """Test adding multiple resolved dependencies into a state."""
+        final_state.add_resolved_dependencies(
+            [
+                ("daiquiri", "1.6.0", "https://pypi.org/simple"),
+                ("flask", "1.1.2", "https://pypi.org/simple"),
+                ("selinon", "1.0.0", "https://pypi.org/simple"),
+            ]
+        )
+        assert final_state.resolved_dependencies == {
+            "daiquiri": ("daiquiri", "1.6.0", "https://pypi.org/simple"),
+            "flask": ("flask", "1.1.2", "https://pypi.org/simple"),
+            "selinon": ("selinon", "1.0.0", "https://pypi.org/simple"),
+        }
+
+        with pytest.raises(ValueError):
+            final_state.add_resolved_dependencies([("daiquiri", "1.5.0", "https://pypi.org/simple")])
+
     def test_get_random_first_unresolved_dependency(self) -> None:
         """Test getting random first unresolved dependency."""
         state = State(score=1.0)
@@ -21,6 +21,7 @@ from typing import Any
 from typing import Dict
 from typing import Generator
 from typing import TYPE_CHECKING
+import attr
 from voluptuous import Required
 from voluptuous import Schema
 
@@ -32,6 +33,7 @@ if TYPE_CHECKING:
     from ..pipeline_builder import PipelineBuilderContext
 
 
+@attr.s(slots=True)
 class ThothS2IInfoBoot(Boot):
     """A boot that adds information about Thoth s2i used."""
 
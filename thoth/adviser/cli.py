@@ -18,7 +18,6 @@
 
 """Thoth-adviser CLI."""
 
-import json
 import logging
 import os
 import random
@@ -33,6 +32,7 @@ from typing import Tuple
 
 import attr
 import click
+import orjson
 import yaml
 import termial_random
 from thoth.analyzer import print_command_result
@@ -59,8 +59,6 @@ from thoth.adviser import __version__ as analyzer_version
 from thoth.adviser.run import subprocess_run
 import thoth.adviser.predictors as predictors
 
-init_logging()
-
 _LOGGER = logging.getLogger("thoth.adviser")
 
 
@@ -121,8 +119,8 @@ def _instantiate_project(
             constraints_content = constraints.replace("\\n", "\n")
 
         try:
-            constraints_instance = Constraints.from_dict(json.loads(constraints_content))
-        except json.decoder.JSONDecodeError:
+            constraints_instance = Constraints.from_dict(orjson.loads(constraints_content))
+        except orjson.JSONDecodeError:
             constraints_instance = Constraints.from_string(constraints_content)
 
     project = Project(
@@ -212,6 +210,9 @@ def _get_predictor_kwargs(predictor_config: Optional[str]) -> Dict[str, Any]:
 )
 def cli(ctx=None, verbose=False, metadata=None):
     """Thoth adviser command line interface."""
+    # Set up logging here rather than on import so that the eager --version option does not pay for it.
+    init_logging()
+
     if ctx:
         ctx.auto_envvar_prefix = "THOTH_ADVISER"
 
@@ -270,10 +271,12 @@ def provenance(
     no_pretty: bool = False,
 ):
     """Check provenance of packages based on configuration."""
-    parameters = locals()
-    parameters.pop("click_ctx")
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        parameters = locals()
+        parameters.pop("click_ctx")
+        _LOGGER.debug("Passed arguments: %s", parameters)
+
     start_time = time.monotonic()
-    _LOGGER.debug("Passed arguments: %s", parameters)
 
     whitelisted_sources = whitelisted_sources.split(",") if whitelisted_sources else []
     result = {
@@ -518,12 +521,12 @@ def advise(
         if os.path.isfile(library_usage):
             try:
                 with open(library_usage, "r") as f:
-                    library_usage = json.load(f)
+                    library_usage = orjson.loads(f.read())
             except Exception:
                 _LOGGER.error("Failed to load library usage file %r", library_usage)
                 raise
         else:
-            library_usage = json.loads(library_usage)
+            library_usage = orjson.loads(library_usage)
 
         # Show library usage in the final report.
         parameters["library_usage"] = library_usage
@@ -533,12 +536,12 @@ def advise(
         if os.path.isfile(labels):
             try:
                 with open(labels, "r") as f:
-                    labels_dict = json.load(f)
+                    labels_dict = orjson.loads(f.read())
             except Exception:
                 _LOGGER.error("Failed to load labels file %r", labels)
                 raise
         else:
-            labels_dict = json.loads(labels)
+            labels_dict = orjson.loads(labels)
 
         # Show labels in the final report.
         parameters["labels"] = labels_dict
@@ -809,12 +812,12 @@ def dependency_monkey(
         if os.path.isfile(library_usage):
             try:
                 with open(library_usage, "r") as f:
-                    library_usage = json.load(f)
+                    library_usage = orjson.loads(f.read())
             except Exception:
                 _LOGGER.error("Failed to load library usage file %r", library_usage)
                 raise
         else:
-            library_usage = json.loads(library_usage)
+            library_usage = orjson.loads(library_usage)
 
         # Show library usage in the final report.
         parameters["library_usage"] = library_usage
@@ -872,10 +875,10 @@ def dependency_monkey(
     context_content = {}
     try:
         with open(context) as f:
-            context_content = json.load(f)
+            context_content = orjson.loads(f.read())
     except (FileNotFoundError, IOError):
         # IOError raised if context is too large to be handled with open.
-        context_content = json.loads(context)
+        context_content = orjson.loads(context)
     parameters["context"] = context_content
 
     dependency_monkey_runner = DependencyMonkey(
@@ -94,14 +94,23 @@ class AdaptiveSimulatedAnnealing(Predictor):
         self._temperature = self._temperature_function(self._temperature, self.context)
 
         # Expand highest promising by default.
-        state = self.context.beam.max()
-
-        # Pick a random state to be expanded if accepted.
-        probable_state_idx = random.randrange(1, self.context.beam.size) if self.context.beam.size > 1 else 0
-        probable_state = self.context.beam.get(probable_state_idx)
-        acceptance_probability = self._compute_acceptance_probability(
-            state.score, probable_state.score, self._temperature
-        )
+        beam = self.context.beam
+        top_state = beam.max()
+        state = top_state
+
+        beam_size = beam.size
+        if beam_size > 1:
+            # Pick a random state to be expanded if accepted.
+            probable_state_idx = random.randrange(1, beam_size)
+            probable_state = beam.get(probable_state_idx)
+            acceptance_probability = self._compute_acceptance_probability(
+                top_state.score, probable_state.score, self._temperature
+            )
+        else:
+            # There is no neighbour candidate to transition to, the top rated state gets expanded.
+            probable_state_idx = 0
+            probable_state = top_state
+            acceptance_probability = 0.0
 
         if probable_state_idx != 0 and acceptance_probability >= random.random():
             # Skip to probable state, do not use the top rated state.
@@ -120,7 +129,7 @@ class AdaptiveSimulatedAnnealing(Predictor):
             self._temperature_history.append(
                 (
                     self._temperature,
-                    state is self.context.beam.max(),
+                    state is top_state,
                     acceptance_probability,
                     self.context.accepted_final_states_count,
                 )
@@ -22,7 +22,6 @@ import os
 import yaml
 from itertools import chain
 
-from collections import OrderedDict
 from collections import deque
 from typing import Any
 from typing import List
@@ -72,12 +71,12 @@ class Prescription:
 
     prescriptions = attr.ib(type=List[Tuple[str, str]], kw_only=True, default=attr.Factory(list))
 
-    boots_dict = attr.ib(type=Dict[str, Dict[str, Any]], kw_only=True, default=attr.Factory(OrderedDict))
-    pseudonyms_dict = attr.ib(type=Dict[str, Dict[str, Any]], kw_only=True, default=attr.Factory(OrderedDict))
-    sieves_dict = attr.ib(type=Dict[str, Dict[str, Any]], kw_only=True, default=attr.Factory(OrderedDict))
-    steps_dict = attr.ib(type=Dict[str, Dict[str, Any]], kw_only=True, default=attr.Factory(OrderedDict))
-    strides_dict = attr.ib(type=Dict[str, Dict[str, Any]], kw_only=True, default=attr.Factory(OrderedDict))
-    wraps_dict = attr.ib(type=Dict[str, Dict[str, Any]], kw_only=True, default=attr.Factory(OrderedDict))
+    boots_dict = attr.ib(type=Dict[str, Dict[str, Any]], kw_only=True, default=attr.Factory(dict))
+    pseudonyms_dict = attr.ib(type=Dict[str, Dict[str, Any]], kw_only=True, default=attr.Factory(dict))
+    sieves_dict = attr.ib(type=Dict[str, Dict[str, Any]], kw_only=True, default=attr.Factory(dict))
+    steps_dict = attr.ib(type=Dict[str, Dict[str, Any]], kw_only=True, default=attr.Factory(dict))
+    strides_dict = attr.ib(type=Dict[str, Dict[str, Any]], kw_only=True, default=attr.Factory(dict))
+    wraps_dict = attr.ib(type=Dict[str, Dict[str, Any]], kw_only=True, default=attr.Factory(dict))
 
     @property
     def units(self) -> Generator[Dict[str, Any], None, None]:
@@ -109,7 +108,7 @@ class Prescription:
         """Validate the given prescription."""
         _LOGGER.debug("Validating prescriptions schema")
 
-        prescription_instance = cls.load(prescriptions)
+        prescription_instance = cls.load(prescriptions, validate_schema=True)
 
         # Verify semantics of prescription.
         any_error = False
@@ -178,67 +177,48 @@ class Prescription:
         prescription_instance: Optional["Prescription"] = None,
         prescription_name: str,
         prescription_release: str,
+        validate_schema: Optional[bool] = None,
     ) -> "Prescription":
         """Instantiate prescription from a dictionary representation.
 
-        If an instance is provided, a safe merge will be performed.
+        If an instance is provided, a safe merge will be performed. Schema validation is done based on
+        THOTH_ADVISER_VALIDATE_PRESCRIPTION_SCHEMA unless explicitly requested using validate_schema.
         """
-        try:
-            PRESCRIPTION_SCHEMA(prescription)
-        except Exception as exc:
-            _LOGGER.exception(
-                "Failed to validate schema for prescription: %s",
-                str(exc),
-            )
-            raise PrescriptionSchemaError(str(exc))
-
-        boots_dict = prescription_instance.boots_dict if prescription_instance is not None else OrderedDict()
-        for boot_spec in prescription["units"].get("boots") or []:
-            name = f"{prescription_name}.{boot_spec['name']}"
-            boot_spec["name"] = name
-            if name in boots_dict:
-                raise PrescriptionDuplicateUnitNameError(f"Boot with name {name!r} is already present")
-            boots_dict[boot_spec["name"]] = boot_spec
-
-        pseudonyms_dict = prescription_instance.pseudonyms_dict if prescription_instance else OrderedDict()
-        for pseudonym_spec in prescription["units"].get("pseudonyms") or []:
-            name = f"{prescription_name}.{pseudonym_spec['name']}"
-            pseudonym_spec["name"] = name
-            if name in pseudonyms_dict:
-                raise PrescriptionDuplicateUnitNameError(f"Pseudonym with name {name!r} is already present")
-            pseudonyms_dict[pseudonym_spec["name"]] = pseudonym_spec
-
-        sieves_dict = prescription_instance.sieves_dict if prescription_instance else OrderedDict()
-        for sieve_spec in prescription["units"].get("sieves") or []:
-            name = f"{prescription_name}.{sieve_spec['name']}"
-            sieve_spec["name"] = name
-            if name in sieves_dict:
-                raise PrescriptionDuplicateUnitNameError(f"Sieve with name {name!r} is already present")
-            sieves_dict[sieve_spec["name"]] = sieve_spec
-
-        steps_dict = prescription_instance.steps_dict if prescription_instance else OrderedDict()
-        for step_spec in prescription["units"].get("steps") or []:
-            name = f"{prescription_name}.{step_spec['name']}"
-            step_spec["name"] = name
-            if name in steps_dict:
-                raise PrescriptionDuplicateUnitNameError(f"Step with name {name!r} is already present")
-            steps_dict[step_spec["name"]] = step_spec
-
-        strides_dict = prescription_instance.strides_dict if prescription_instance else OrderedDict()
-        for stride_spec in prescription["units"].get("strides") or []:
-            name = f"{prescription_name}.{stride_spec['name']}"
-            stride_spec["name"] = name
-            if name in strides_dict:
-                raise PrescriptionDuplicateUnitNameError(f"Stride with name {name!r} is already present")
-            strides_dict[stride_spec["name"]] = stride_spec
-
-        wraps_dict = prescription_instance.wraps_dict if prescription_instance else OrderedDict()
-        for wrap_spec in prescription["units"].get("wraps") or []:
-            name = f"{prescription_name}.{wrap_spec['name']}"
-            wrap_spec["name"] = name
-            if name in wraps_dict:
-                raise PrescriptionDuplicateUnitNameError(f"Wrap with name {name!r} is already present")
-            wraps_dict[wrap_spec["name"]] = wrap_spec
+        if validate_schema is None:
+            validate_schema = cls._VALIDATE_PRESCRIPTION_SCHEMA
+
+        if validate_schema:
+            try:
+                PRESCRIPTION_SCHEMA(prescription)
+            except Exception as exc:
+                _LOGGER.exception(
+                    "Failed to validate schema for prescription: %s",
+                    str(exc),
+                )
+                raise PrescriptionSchemaError(str(exc))
+
+        boots_dict = prescription_instance.boots_dict if prescription_instance is not None else {}
+        pseudonyms_dict = prescription_instance.pseudonyms_dict if prescription_instance is not None else {}
+        sieves_dict = prescription_instance.sieves_dict if prescription_instance is not None else {}
+        steps_dict = prescription_instance.steps_dict if prescription_instance is not None else {}
+        strides_dict = prescription_instance.strides_dict if prescription_instance is not None else {}
+        wraps_dict = prescription_instance.wraps_dict if prescription_instance is not None else {}
+
+        units = prescription["units"]
+        for unit_kind, unit_type, units_dict in (
+            ("boots", "Boot", boots_dict),
+            ("pseudonyms", "Pseudonym", pseudonyms_dict),
+            ("sieves", "Sieve", sieves_dict),
+            ("steps", "Step", steps_dict),
+            ("strides", "Stride", strides_dict),
+            ("wraps", "Wrap", wraps_dict),
+        ):
+            for unit_spec in units.get(unit_kind) or []:
+                name = f"{prescription_name}.{unit_spec['name']}"
+                unit_spec["name"] = name
+                if name in units_dict:
+                    raise PrescriptionDuplicateUnitNameError(f"{unit_type} with name {name!r} is already present")
+                units_dict[name] = unit_spec
 
         if prescription_instance:
             # Adjust release info at the end once successful.
@@ -269,7 +249,7 @@ class Prescription:
         )
 
     @classmethod
-    def load(cls, *prescriptions: str) -> "Prescription":
+    def load(cls, *prescriptions: str, validate_schema: Optional[bool] = None) -> "Prescription":
         """Load prescription from files or from their YAML representation."""
         queue = deque([(p, cls._PRESCRIPTION_DEFAULT_NAME, cls._PRESCRIPTION_DEFAULT_RELEASE) for p in prescriptions])
         prescription_instance = Prescription()
@@ -289,6 +269,7 @@ class Prescription:
                         prescription_instance=prescription_instance,
                         prescription_name=prescription_name,
                         prescription_release=prescription_release,
+                        validate_schema=validate_schema,
                     )
             elif os.path.isdir(prescription):
                 prescription_metadata_file_path = os.path.join(prescription, cls._PRESCRIPTION_METADATA_FILE)
@@ -325,6 +306,7 @@ class Prescription:
                     prescription_instance=prescription_instance,
                     prescription_name=prescription_name,
                     prescription_release=prescription_release,
+                    validate_schema=validate_schema,
                 )
 
         if prescription_instance.is_empty():
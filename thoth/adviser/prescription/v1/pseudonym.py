@@ -20,6 +20,7 @@
 import logging
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Tuple
 from typing import Generator
 from typing import Optional
@@ -57,6 +58,12 @@ class PseudonymPrescription(UnitPrescription):
     _logged = attr.ib(type=bool, kw_only=True, init=False, default=False)
     _specifier = attr.ib(type=Optional[SpecifierSet], kw_only=True, init=False, default=None)
     _index_url = attr.ib(type=Optional[str], kw_only=True, init=False, default=None)
+    _specifier_matches = attr.ib(type=Dict[str, bool], kw_only=True, init=False, factory=dict)
+    _yield_matched_version = attr.ib(type=bool, kw_only=True, init=False, default=False)
+    _yield_name = attr.ib(type=Optional[str], kw_only=True, init=False, default=None)
+    _yield_locked_version = attr.ib(type=Optional[str], kw_only=True, init=False, default=None)
+    _yield_index_url = attr.ib(type=Optional[str], kw_only=True, init=False, default=None)
+    _pseudonyms = attr.ib(type=Dict[Optional[str], List[Tuple[str, str, str]]], kw_only=True, init=False, factory=dict)
 
     @staticmethod
     def is_pseudonym_unit_type() -> bool:
@@ -83,38 +90,63 @@ class PseudonymPrescription(UnitPrescription):
             self._specifier.prereleases = True
 
         self._index_url = package_version.get("index_url")
+
+        to_yield = self.run_prescription["yield"]
+        to_yield_package_version = to_yield.get("package_version") or {}
+        self._yield_matched_version = bool(to_yield.get("yield_matched_version"))
+        self._yield_name = to_yield_package_version.get("name")
+        self._yield_index_url = to_yield_package_version.get("index_url")
+        locked_version = to_yield_package_version.get("locked_version")
+        self._yield_locked_version = locked_version[2:] if locked_version else locked_version
+
+        self._specifier_matches.clear()
+        self._pseudonyms.clear()
         self._logged = False
         super().pre_run()
 
     def run(self, package_version: PackageVersion) -> Generator[Tuple[str, str, str], None, None]:
         """Run main entry-point for pseudonyms to map packages to their counterparts."""
-        if (self._index_url and package_version.index.url != self._index_url) or (
-            self._specifier is not None and package_version.locked_version not in self._specifier
-        ):
+        if self._index_url and package_version.index.url != self._index_url:
             yield from ()
             return None
 
-        to_yield = self.run_prescription["yield"]
-        to_yield_package_version = to_yield.get("package_version") or {}
-        if to_yield.get("yield_matched_version"):
+        if self._specifier is not None:
+            # The same package versions are checked repeatedly across resolver iterations, avoid
+            # parsing the version string on each check.
+            locked_version = package_version.locked_version
+            version_matched = self._specifier_matches.get(locked_version)
+            if version_matched is None:
+                version_matched = locked_version in self._specifier
+                self._specifier_matches[locked_version] = version_matched
+
+            if not version_matched:
+                yield from ()
+                return None
+
+        if self._yield_matched_version:
             pseudonym_package_version = package_version.locked_version
         else:
-            pseudonym_package_version = to_yield_package_version.get("locked_version")
-            if pseudonym_package_version:
-                pseudonym_package_version = pseudonym_package_version[2:]
-
-        runtime_environment = self.context.project.runtime_environment
-        pseudonyms = self.context.graph.get_solved_python_package_versions_all(
-            package_name=to_yield_package_version.get("name"),
-            package_version=pseudonym_package_version,
-            index_url=to_yield_package_version.get("index_url"),
-            count=None,
-            os_name=runtime_environment.operating_system.name,
-            os_version=runtime_environment.operating_system.version,
-            python_version=runtime_environment.python_version,
-            distinct=True,
-            is_missing=False,
-        )
+            pseudonym_package_version = self._yield_locked_version
+
+        pseudonyms = self._pseudonyms.get(pseudonym_package_version)
+        if pseudonyms is None:
+            # Pseudonyms are queried once per version, the unit is run each time the package is introduced to a state.
+            runtime_environment = self.context.project.runtime_environment
+            pseudonyms = [
+                (pseudonym[0], pseudonym[1], pseudonym[2])
+                for pseudonym in self.context.graph.get_solved_python_package_versions_all(
+                    package_name=self._yield_name,
+                    package_version=pseudonym_package_version,
+                    index_url=self._yield_index_url,
+                    count=None,
+                    os_name=runtime_environment.operating_system.name,
+                    os_version=runtime_environment.operating_system.version,
+                    python_version=runtime_environment.python_version,
+                    distinct=True,
+                    is_missing=False,
+                )
+            ]
+            self._pseudonyms[pseudonym_package_version] = pseudonyms
 
         if pseudonyms and not self._logged:
             self._logged = True
@@ -128,4 +160,4 @@ class PseudonymPrescription(UnitPrescription):
                 pseudonym,
                 package_version.to_tuple(),
             )
-            yield pseudonym[0], pseudonym[1], pseudonym[2]
+            yield pseudonym
@@ -22,6 +22,8 @@ import attr
 from typing import Any
 from typing import Dict
 from typing import Generator
+from typing import List
+from typing import Optional
 from typing import TYPE_CHECKING
 
 from thoth.adviser.state import State
@@ -49,6 +51,9 @@ class WrapPrescription(UnitPrescription):
         }
     )
 
+    _justification = attr.ib(type=Optional[List[Dict[str, Any]]], kw_only=True, init=False, default=None)
+    _advised_manifest_changes = attr.ib(type=Any, kw_only=True, init=False, default=None)
+
     @staticmethod
     def is_wrap_unit_type() -> bool:
         """Check if this unit is of type wrap."""
@@ -67,7 +72,10 @@ class WrapPrescription(UnitPrescription):
 
     def pre_run(self) -> None:
         """Prepare this pipeline unit before run."""
-        self._prepare_justification_link(self.run_prescription.get("justification", []))
+        run_prescription = self.run_prescription
+        self._justification = run_prescription.get("justification")
+        self._prepare_justification_link(self._justification or [])
+        self._advised_manifest_changes = run_prescription.get("advised_manifest_changes")
         super().pre_run()
 
     def run(self, state: State) -> None:
@@ -75,12 +83,10 @@ class WrapPrescription(UnitPrescription):
         if not self._run_state(state):
             return None
 
-        justification = self.run_prescription.get("justification")
-        if justification:
-            state.add_justification(justification)
+        if self._justification:
+            state.add_justification(self._justification)
 
-        advised_manifest_changes = self.run_prescription.get("advised_manifest_changes")
-        if advised_manifest_changes:
-            state.advised_manifest_changes.append(advised_manifest_changes)
+        if self._advised_manifest_changes:
+            state.advised_manifest_changes.append(self._advised_manifest_changes)
 
         self._run_base()
@@ -20,6 +20,7 @@
 import os
 import json
 import logging
+from functools import lru_cache
 from typing import Any
 from typing import Dict
 from typing import List
@@ -43,6 +44,17 @@ from .utils import log_once
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_justification_metadata(metadata: str) -> List[Dict[str, Any]]:
+    """Parse justification from adviser metadata, the result is shared by all the products produced."""
+    try:
+        metadata_content = json.loads(metadata)
+        return (metadata_content.get("thoth.adviser") or {}).get("justification") or []
+    except Exception:
+        _LOGGER.exception("Failed to parse adviser metadata")
+        return []
+
+
 @attr.s(slots=True, eq=False, order=False)
 class Product:
     """A representation of an advised stack."""
@@ -141,11 +153,7 @@ class Product:
         justification_metadata: List[Dict[str, Any]] = []
         metadata = os.getenv("THOTH_ADVISER_METADATA")
         if metadata:
-            try:
-                metadata_content = json.loads(metadata)
-                justification_metadata = (metadata_content.get("thoth.adviser") or {}).get("justification") or []
-            except Exception:
-                _LOGGER.exception("Failed to parse adviser metadata")
+            justification_metadata = _get_justification_metadata(metadata)
 
         justification = justification_metadata + state.justification
         if not justification:
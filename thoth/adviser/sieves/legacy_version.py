@@ -18,6 +18,7 @@
 """A sieve to filter out legacy versions."""
 
 import logging
+from itertools import filterfalse
 from typing import Any
 from typing import Dict
 from typing import Generator
@@ -36,6 +37,11 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+def _is_legacy_version(package_version: PackageVersion) -> bool:
+    """Check if the given package version uses a legacy version string."""
+    return package_version.semantic_version.is_legacy_version
+
+
 @attr.s(slots=True)
 class LegacyVersionSieve(Sieve):
     """A sieve to filter out legacy versions.
@@ -65,14 +71,19 @@ class LegacyVersionSieve(Sieve):
 
     def run(self, package_versions: Generator[PackageVersion, None, None]) -> Generator[PackageVersion, None, None]:
         """Cut-off legacy versions from the resolution process."""
+        if not _LOGGER.isEnabledFor(logging.WARNING):
+            # Nothing to report, let the filtering be done without a Python-level loop.
+            yield from filterfalse(_is_legacy_version, package_versions)
+            return None
+
         for package_version in package_versions:
-            if package_version.semantic_version.is_legacy_version:
+            if _is_legacy_version(package_version):
                 package_tuple = package_version.to_tuple()
                 if package_tuple not in self._messages_logged:
                     self._messages_logged.add(package_tuple)
                     _LOGGER.warning(
                         "Removing package %s as the version identifier is a legacy version string",
-                        package_version.to_tuple(),
+                        package_tuple,
                     )
                 continue
 
@@ -23,6 +23,7 @@ from typing import Generator
 from typing import TYPE_CHECKING
 import logging
 
+import attr
 from thoth.common import get_justification_link as jl
 from thoth.python import PackageVersion
 
@@ -37,6 +38,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+@attr.s(slots=True)
 class TensorFlow240AVX2IllegalInstructionSieve(Sieve):
     """A sieve that filters out TensorFlow==2.4.0 build as it requires AVX2 instruction set.
 
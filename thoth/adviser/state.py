@@ -23,6 +23,7 @@ from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Generator
+from typing import Iterable
 import random
 import weakref
 
@@ -172,6 +173,11 @@ class State:
             )
         self.resolved_dependencies[package_tuple[0]] = package_tuple
 
+    def add_resolved_dependencies(self, package_tuples: Iterable[Tuple[str, str, str]]) -> None:
+        """Add multiple resolved dependencies into the state."""
+        for package_tuple in package_tuples:
+            self.add_resolved_dependency(package_tuple)
+
     def mark_dependency_resolved(self, package_tuple: Tuple[str, str, str]) -> None:
         """Mark the given dependency as resolved in the current state."""
         self.remove_unresolved_dependency(package_tuple)
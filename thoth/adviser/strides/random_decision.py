@@ -48,5 +48,5 @@ class RandomDecisionStride(Stride):
 
     def run(self, state: State) -> None:
         """Flip a coin and decide - tails are not acceptable."""
-        if bool(random.getrandbits(1)):
+        if random.getrandbits(1):
             raise NotAcceptable(f"State with score {state.score!r} was randomly discarded by flipping a coin")
@@ -22,6 +22,8 @@ from typing import Generator
 from typing import Dict
 from typing import Any
 
+import attr
+
 from ..state import State
 from ..wrap import Wrap
 
@@ -29,6 +31,7 @@ if TYPE_CHECKING:
     from ..pipeline_builder import PipelineBuilderContext
 
 
+@attr.s(slots=True)
 class PyPIReleaseWrap(Wrap):
     """A wrap that adds information about Python packages present on PyPI."""
 